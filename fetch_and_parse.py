@@ -11,66 +11,234 @@ The script is organized into well-defined functions with comments. It will fail
 gracefully with clear instructions if Playwright is not installed.
 
 Usage examples:
-  # capture + parse, removing the intermediate capture file
+  # capture + parse (captured responses stay in memory)
   python fetch_and_parse.py --url https://luma.com/devconnect --output events_all_extracted.json
 
-  # keep the raw Playwright capture for debugging
+  # capture several calendars with a single browser launch
+  python fetch_and_parse.py --urls https://luma.com/devconnect https://luma.com/ethereum --output events.json
+
+  # keep the raw Playwright capture for debugging (gzip-compressed with --compress or a .gz path)
   python fetch_and_parse.py --keep-capture --capture all_responses.json --output events.json
+  python fetch_and_parse.py --keep-capture --compress --output events.json
+
+  # stream events as JSON Lines (one event per line)
+  python fetch_and_parse.py --jsonl --output events.jsonl
+
+  # columnar Parquet output (requires pyarrow)
+  python fetch_and_parse.py --format parquet --output events.parquet
 
 Requirements:
   pip install playwright
   playwright install
 
+Optional (faster JSON parsing/serialization, streaming capture reads):
+  pip install orjson ijson
+
+Optional (Parquet output via --format parquet):
+  pip install pyarrow
+
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import gzip
 import json
+import linecache
 import time
-import os
+from concurrent.futures import ProcessPoolExecutor
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; without it the capture file is loaded whole
+    ijson = None
 
 
 API_URL_PART = "api2.luma.com/calendar/get"
+ENTRIES_KEY = "entries"  # top-level list of event records in calendar API responses
 DEFAULT_CAPTURE = "all_responses.json"
 DEFAULT_OUTPUT = "events_all_extracted.json"
 BASE_EVENT_URL = "https://luma.com/"
+SCROLL_SETTLE_TIMEOUT_MS = 1500  # max wait for a calendar API response after each scroll
+
+# Output columns and where each value comes from, in row order. The source is the
+# accessor the value is read with (record, event, geo, coordinate or ticket dict)
+# and the key read; a None accessor names a value computed in `extract_event_row`.
+# Rows carry the ticket price in cents at the "ticket_price_usd" position; sinks
+# convert it to USD.
+EVENT_FIELD_SOURCES: Tuple[Tuple[str, Optional[str], str], ...] = (
+    ("name", "ev", "name"),
+    ("url", None, "full_url"),
+    # -- full geo_address_info fields
+    ("geo_address_info_city", "geo", "city"),
+    ("geo_address_info_type", "geo", "type"),
+    ("geo_address_info_region", "geo", "region"),
+    ("geo_address_info_address", "geo", "address"),
+    ("geo_address_info_country", "geo", "country"),
+    ("geo_address_info_place_id", "geo", "place_id"),
+    ("geo_address_info_city_state", "geo", "city_state"),
+    ("geo_address_info_description", "geo", "description"),
+    ("geo_address_info_country_code", "geo", "country_code"),
+    ("geo_address_info_full_address", "geo", "full_address"),
+    ("geo_address_info_apple_maps_place_id", "geo", "apple_maps_place_id"),
+    ("geo_address_info_mode", "geo", "mode"),
+    ("geo_address_visibility", "ev", "geo_address_visibility"),
+    ("latitude", "coord", "latitude"),
+    ("longitude", "coord", "longitude"),
+    # Ticket info
+    ("ticket_is_free", "t", "is_free"),
+    ("ticket_price_usd", None, "price_cents"),
+    ("ticket_require_approval", "t", "require_approval"),
+    ("ticket_is_sold_out", "t", "is_sold_out"),
+    ("ticket_count", "rec", "ticket_count"),
+    ("guest_count", "rec", "guest_count"),
+    ("ticket_max_price", "t", "max_price"),
+    ("ticket_spots_remaining", "t", "spots_remaining"),
+    ("ticket_is_near_capacity", "t", "is_near_capacity"),
+    ("ticket_currency_info", "t", "currency_info"),
+    ("waitlist_enabled", "ev", "waitlist_enabled"),
+)
+EVENT_FIELDS: Tuple[str, ...] = tuple(name for name, _, _ in EVENT_FIELD_SOURCES)
+
+# Low-cardinality string fields repeated across most events; extracted values are
+# passed through sys.intern so each distinct string is stored once.
+INTERNED_FIELDS = frozenset({
+    "geo_address_info_city",
+    "geo_address_info_type",
+    "geo_address_info_region",
+    "geo_address_info_country",
+    "geo_address_info_country_code",
+    "geo_address_info_mode",
+    "geo_address_visibility",
+})
+
+# Columns stored as float64 in Parquet output (JSON may decode whole numbers as int).
+PARQUET_FLOAT_FIELDS = frozenset({"latitude", "longitude", "ticket_price_usd"})
+PRICE_INDEX = EVENT_FIELDS.index("ticket_price_usd")
+
+
+def open_capture(path: str, mode: str) -> BinaryIO:
+    """Open a capture file in binary `mode`, transparently gzip-compressed if `path` ends in `.gz`."""
+    if path.endswith(".gz"):
+        # level 6 keeps most of the size win of 9 at a fraction of the CPU
+        return gzip.open(path, mode, compresslevel=6)
+    return open(path, mode)
+
+
+def json_loads(data: bytes) -> Any:
+    """Decode JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dump(obj: Any, f: BinaryIO) -> None:
+    """Write `obj` as indented UTF-8 JSON to the binary file `f`, using orjson when available."""
+    if orjson is not None:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        f.write(json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8"))
+
+
+def write_jsonl(items: Iterable[Any], f: BinaryIO) -> int:
+    """Write each item as one JSON line to the binary file `f`. Returns the number of lines written."""
+    count = 0
+    for item in items:
+        if orjson is not None:
+            f.write(orjson.dumps(item))
+        else:
+            f.write(json.dumps(item, ensure_ascii=False).encode("utf-8"))
+        f.write(b"\n")
+        count += 1
+    return count
+
+
+def _import_playwright() -> Any:
+    """Return the `playwright.async_api` module.
 
-
-def capture_with_playwright(url: str, capture_path: str, timeout_idle: int = 30, headless: bool = True) -> int:
-    """Open `url` with Playwright, scroll until no new calendar API responses are seen
-    for `timeout_idle` seconds, and save captured responses to `capture_path`.
-
-    Returns the number of captured responses.
     Raises RuntimeError with instructions if Playwright is not available.
     """
     try:
-        from playwright.sync_api import sync_playwright
+        from playwright import async_api
     except Exception as exc:
         raise RuntimeError(
             "Playwright is not installed. Install it with: `pip install playwright` and run `playwright install`"
         ) from exc
+    return async_api
 
-    captured: List[Dict[str, Any]] = []
 
-    with sync_playwright() as pw:
-        browser = pw.chromium.launch(headless=headless)
-        context = browser.new_context()
-        page = context.new_page()
+class LumaCapturer:
+    """Async context manager holding one Playwright browser and context open so several
+    pages can be captured without relaunching the browser. Cookies and other session
+    state in the shared context carry over from one page to the next.
+
+        async with LumaCapturer(headless=True) as capturer:
+            captured = await capturer.capture("https://luma.com/devconnect")
+
+    Entering raises RuntimeError with instructions if Playwright is not available.
+    """
+
+    def __init__(self, headless: bool = True) -> None:
+        self.headless = headless
+        self._api: Any = None
+        self._pw: Any = None
+        self._browser: Any = None
+        self._context: Any = None
+
+    async def __aenter__(self) -> "LumaCapturer":
+        self._api = _import_playwright()
+        self._pw = await self._api.async_playwright().start()
+        try:
+            self._browser = await self._pw.chromium.launch(headless=self.headless)
+            self._context = await self._browser.new_context()
+        except BaseException:
+            await self._pw.stop()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        try:
+            await self._browser.close()
+        finally:
+            await self._pw.stop()
+
+    async def capture(self, url: str, timeout_idle: int = 30) -> List[Dict[str, Any]]:
+        """Open `url` in a new page and scroll until no new calendar API responses are
+        seen for `timeout_idle` seconds.
 
-        def on_response(resp):
+        Response bodies are read concurrently with scrolling. Returns the list of
+        captured responses; the page is closed afterwards.
+        """
+        captured: List[Dict[str, Any]] = []
+        idle_since = time.monotonic()
+
+        page = await self._context.new_page()
+
+        def is_api_response(resp) -> bool:
+            return API_URL_PART in resp.url
+
+        async def on_response(resp):
+            nonlocal idle_since
             try:
-                if API_URL_PART in resp.url:
-                    # attempt to read JSON body, fall back to text
+                if is_api_response(resp):
+                    idle_since = time.monotonic()
+                    # fetch the body once, decode as JSON, fall back to text
                     try:
-                        body = resp.json()
+                        raw = await resp.body()
                     except Exception:
-                        try:
-                            body = json.loads(resp.text())
-                        except Exception:
-                            body = {"raw_text": resp.text()}
+                        raw = None
+                    try:
+                        body = json_loads(raw)
+                    except Exception:
+                        body = {"raw_text": raw.decode("utf-8", errors="replace") if raw is not None else None}
                     captured.append({"url": resp.url, "status": resp.status, "body": body})
             except Exception:
                 # ignore errors while capturing a response
@@ -78,145 +246,385 @@ def capture_with_playwright(url: str, capture_path: str, timeout_idle: int = 30,
 
         page.on("response", on_response)
 
-        page.goto(url)
+        try:
+            await page.goto(url)
+
+            # Scroll repeatedly until no calendar API response has arrived for timeout_idle
+            # seconds; after each scroll, move on as soon as the next response shows up
+            idle_since = time.monotonic()
+            while time.monotonic() - idle_since <= timeout_idle:
+                try:
+                    async with page.expect_response(is_api_response, timeout=SCROLL_SETTLE_TIMEOUT_MS):
+                        await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
+                except self._api.TimeoutError:
+                    pass
+        finally:
+            await page.close()
+
+        return captured
+
+
+async def capture_urls(
+    urls: Iterable[str], capture_path: Optional[str] = None, timeout_idle: int = 30, headless: bool = True
+) -> List[Dict[str, Any]]:
+    """Capture calendar API responses from each of `urls` in turn, sharing one browser.
+    If `capture_path` is given, all captured responses are also saved there.
+
+    Returns the combined list of captured responses.
+    Raises RuntimeError with instructions if Playwright is not available.
+    """
+    captured: List[Dict[str, Any]] = []
+    async with LumaCapturer(headless=headless) as capturer:
+        for url in urls:
+            captured.extend(await capturer.capture(url, timeout_idle=timeout_idle))
 
-        last_count = 0
-        idle_since = time.time()
-        # Scroll repeatedly until we see no new captures for timeout_idle seconds
-        while True:
-            page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
-            time.sleep(1)
-            if len(captured) > last_count:
-                last_count = len(captured)
-                idle_since = time.time()
-            if time.time() - idle_since > timeout_idle:
-                break
+    # optionally write capture to file
+    if capture_path:
+        with open_capture(capture_path, "wb") as f:
+            json_dump(captured, f)
 
-        browser.close()
+    return captured
 
-    # write capture to file
-    with open(capture_path, "w", encoding="utf-8") as f:
-        json.dump(captured, f, ensure_ascii=False, indent=2)
 
-    return len(captured)
+async def capture_with_playwright(
+    url: str, capture_path: Optional[str] = None, timeout_idle: int = 30, headless: bool = True
+) -> List[Dict[str, Any]]:
+    """Open `url` with Playwright and scroll until no new calendar API responses are seen
+    for `timeout_idle` seconds. If `capture_path` is given, the captured responses are
+    also saved there.
+
+    Returns the list of captured responses.
+    Raises RuntimeError with instructions if Playwright is not available.
+    """
+    return await capture_urls([url], capture_path, timeout_idle=timeout_idle, headless=headless)
 
 
 def find_event_dicts(obj: Any) -> List[Dict[str, Any]]:
-    """Recursively find dicts that contain an 'event' key mapping to a dict."""
+    """Find all dicts (at any depth) that contain an 'event' key mapping to a dict.
+
+    Walks the tree with an explicit stack instead of recursion; children are pushed
+    in reverse so records are returned in document order.
+    """
     found: List[Dict[str, Any]] = []
-    if isinstance(obj, dict):
-        if "event" in obj and isinstance(obj["event"], dict):
-            found.append(obj)
-        for v in obj.values():
-            found.extend(find_event_dicts(v))
-    elif isinstance(obj, list):
-        for item in obj:
-            found.extend(find_event_dicts(item))
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        if type(cur) is dict:
+            if type(cur.get("event")) is dict:
+                found.append(cur)
+            stack.extend(reversed(cur.values()))
+        elif type(cur) is list:
+            stack.extend(reversed(cur))
     return found
 
 
-def extract_event_fields(record: Dict[str, Any]) -> Dict[str, Optional[Any]]:
-    """Extract the requested fields from a single record containing `event`."""
-    ev = record.get("event", {}) or {}
-    geo = ev.get("geo_address_info") or {}
-    coord = ev.get("coordinate") or {}
-    ticket = record.get("ticket_info") or ev.get("ticket_info") or {}
+def _get_none(*_: Any) -> None:
+    """Stand-in for `dict.get` when the container is missing or not a dict."""
+    return None
+
+
+_EXTRACT_ROW_TEMPLATE = '''\
+def extract_event_row(
+    record, BASE_EVENT_URL=BASE_EVENT_URL, _get_none=_get_none, _intern=_intern, type=type, dict=dict, str=str
+):
+    """Extract the requested fields from a single record containing `event`.
 
-    url_val = ev.get("url")
+    Returns a tuple of values positionally matching `EVENT_FIELDS`, with the ticket
+    price still in cents (None when free or unknown); see `row_to_event`.
+    Generated from `EVENT_FIELD_SOURCES` by `_build_extract_event_row`.
+    """
+    # bind the accessors once; this function runs for every extracted event
+    rec_get = record.get
+    ev = rec_get("event") or {{}}
+    ev_get = ev.get
+    geo_get = (ev_get("geo_address_info") or {{}}).get
+    coord_get = (ev_get("coordinate") or {{}}).get
+    ticket = rec_get("ticket_info") or ev_get("ticket_info") or {{}}
+    t_is_dict = type(ticket) is dict
+    t_get = ticket.get if t_is_dict else _get_none
+
+    url_val = ev_get("url")
     full_url = None
     if url_val:
         if url_val.startswith("/"):
             url_val = url_val[1:]
         full_url = BASE_EVENT_URL + url_val
 
-    return {
-        "name": ev.get("name"),
-        "url": full_url,
-        # -- full geo_address_info fields
-        "geo_address_info_city": geo.get("city"),
-        "geo_address_info_type": geo.get("type"),
-        "geo_address_info_region": geo.get("region"),
-        "geo_address_info_address": geo.get("address"),
-        "geo_address_info_country": geo.get("country"),
-        "geo_address_info_place_id": geo.get("place_id"),
-        "geo_address_info_city_state": geo.get("city_state"),
-        "geo_address_info_description": geo.get("description"),
-        "geo_address_info_country_code": geo.get("country_code"),
-        "geo_address_info_full_address": geo.get("full_address"),
-        "geo_address_info_apple_maps_place_id": geo.get("apple_maps_place_id"),
-        "geo_address_info_mode": geo.get("mode"),
-        "geo_address_visibility": ev.get("geo_address_visibility"),
-        "latitude": coord.get("latitude"),
-        "longitude": coord.get("longitude"),
-        # Ticket info
-        "ticket_is_free": (ticket.get("is_free") if isinstance(ticket, dict) else None),
-        "ticket_price_usd": (None if ticket.get("is_free") else (
-            (ticket.get("price") or {}).get("cents") / 100.0 if (ticket.get("price") or {}).get("cents") is not None else None
-        )),
-        "ticket_require_approval": (ticket.get("require_approval") if isinstance(ticket, dict) else None),
-        "ticket_is_sold_out": (ticket.get("is_sold_out") if isinstance(ticket, dict) else None),
-        "ticket_count": record.get("ticket_count"),
-        "guest_count": record.get("guest_count"),
-        "ticket_max_price": (ticket.get("max_price") if isinstance(ticket, dict) else None),
-        "ticket_spots_remaining": (ticket.get("spots_remaining") if isinstance(ticket, dict) else None),
-        "ticket_is_near_capacity": (ticket.get("is_near_capacity") if isinstance(ticket, dict) else None),
-        "ticket_currency_info": (ticket.get("currency_info") if isinstance(ticket, dict) else None),
-        "waitlist_enabled": ev.get("waitlist_enabled"),
-    }
+    price_cents = None
+    if t_is_dict and not t_get("is_free"):
+        price_cents = (t_get("price") or {{}}).get("cents")
 
+    return (
+{values}
+    )
+'''
 
-def parse_capture_to_events(capture_path: str) -> Tuple[int, List[Dict[str, Optional[Any]]]]:
-    """Read a Playwright capture file and extract event fields from all captured responses.
 
+def _build_extract_event_row() -> Any:
+    """Compile `extract_event_row` for the fixed `EVENT_FIELD_SOURCES` schema.
+
+    The row tuple is emitted as one flat expression with every lookup inlined, so
+    the column order cannot drift from `EVENT_FIELDS` and no per-field dispatch
+    happens at runtime. `INTERNED_FIELDS` get an inline `sys.intern` for strings.
+    """
+    lines = []
+    for name, accessor, key in EVENT_FIELD_SOURCES:
+        expr = key if accessor is None else f"{accessor}_get({key!r})"
+        if name in INTERNED_FIELDS:
+            expr = f"(_intern(v) if type(v := {expr}) is str else v)"
+        lines.append(f"        {expr},  # {name}")
+    source = _EXTRACT_ROW_TEMPLATE.format(values="\n".join(lines))
+    filename = "<generated extract_event_row>"
+    # register the source so tracebacks and inspect.getsource() can show it
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    namespace: Dict[str, Any] = {"BASE_EVENT_URL": BASE_EVENT_URL, "_get_none": _get_none, "_intern": sys.intern}
+    exec(compile(source, filename, "exec"), namespace)
+    func = namespace["extract_event_row"]
+    func.__module__ = __name__
+    return func
+
+
+extract_event_row = _build_extract_event_row()
+
+
+def row_to_event(row: Tuple[Optional[Any], ...]) -> Dict[str, Optional[Any]]:
+    """Build the output event dict from an `extract_event_row` row, converting cents to USD."""
+    event = dict(zip(EVENT_FIELDS, row))
+    cents = row[PRICE_INDEX]
+    if cents is not None:
+        event["ticket_price_usd"] = cents / 100.0
+    return event
+
+
+def extract_event_fields(record: Dict[str, Any]) -> Dict[str, Optional[Any]]:
+    """Extract the requested fields from a single record containing `event`."""
+    return row_to_event(extract_event_row(record))
+
+
+def iter_event_rows(obj: Any) -> Iterator[Tuple[Optional[Any], ...]]:
+    """Walk `obj` like `find_event_dicts`, yielding `extract_event_row` for each event
+    record as soon as it is reached.
+
+    Fusing the search and the extraction visits every node once and never builds
+    the intermediate list of records.
+    """
+    stack = [obj]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        cur = pop()
+        if type(cur) is dict:
+            if type(cur.get("event")) is dict:
+                yield extract_event_row(cur)
+            extend(reversed(cur.values()))
+        elif type(cur) is list:
+            extend(reversed(cur))
+
+
+def iter_captures(capture_path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the captured responses stored in `capture_path` one at a time.
+
+    With ijson installed the top-level array is streamed, so only one capture is
+    held in memory at once; otherwise the whole file is decoded up front. Files
+    ending in `.gz` are decompressed on the fly.
+    """
+    with open_capture(capture_path, "rb") as f:
+        if ijson is not None:
+            # use_float keeps numbers as float instead of Decimal
+            yield from ijson.items(f, "item", use_float=True)
+        else:
+            yield from json_loads(f.read())
+
+
+def iter_capture_rows(cap: Dict[str, Any]) -> Iterator[Tuple[Optional[Any], ...]]:
+    """Yield an `EVENT_FIELDS` row for every event record in a single captured response.
+
+    Calendar API bodies keep their event records in a top-level `entries` list, so
+    those are read directly; the full tree walk is only used when that yields nothing.
+    """
+    body = cap.get("body")
+    if not body:
+        return
+
+    entries = body.get(ENTRIES_KEY) if type(body) is dict else None
+    if type(entries) is list:
+        found = False
+        for entry in entries:
+            if type(entry) is dict and type(entry.get("event")) is dict:
+                found = True
+                yield extract_event_row(entry)
+        if found:
+            return
+
+    yield from iter_event_rows(body)
+
+
+def iter_capture_events(cap: Dict[str, Any]) -> Iterator[Dict[str, Optional[Any]]]:
+    """Yield the extracted event fields for every event record in a single captured response."""
+    for row in iter_capture_rows(cap):
+        yield row_to_event(row)
+
+
+def _capture_rows(cap: Dict[str, Any]) -> List[Tuple[Optional[Any], ...]]:
+    """Process-pool worker: all `EVENT_FIELDS` rows of one captured response."""
+    return list(iter_capture_rows(cap))
+
+
+def iter_rows(captures: Iterable[Dict[str, Any]], workers: int = 1) -> Iterator[Tuple[Optional[Any], ...]]:
+    """Lazily yield `EVENT_FIELDS` rows across all `captures`.
+
+    With `workers` > 1 the captures are split across a process pool (results keep
+    capture order); this pays off only when the bodies are large, since each
+    capture has to be pickled to a worker.
+    """
+    if workers <= 1:
+        for cap in captures:
+            yield from iter_capture_rows(cap)
+        return
+
+    captures = list(captures)
+    # a few chunks per worker keeps the load balanced without per-capture IPC
+    chunksize = max(1, len(captures) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for rows in ex.map(_capture_rows, captures, chunksize=chunksize):
+            yield from rows
+
+
+def iter_events(captures: Iterable[Dict[str, Any]], workers: int = 1) -> Iterator[Dict[str, Optional[Any]]]:
+    """Lazily yield extracted event fields across all `captures` (see `iter_rows`)."""
+    for row in iter_rows(captures, workers):
+        yield row_to_event(row)
+
+
+def extract_from_captures(
+    captures: Iterable[Dict[str, Any]], workers: int = 1
+) -> Tuple[int, List[Dict[str, Optional[Any]]]]:
+    """Extract event fields from captured responses, either in memory or streamed from disk.
+
+    `workers` > 1 extracts in a process pool (see `iter_rows`).
     Returns (num_captures, list_of_event_dicts).
     """
-    with open(capture_path, "r", encoding="utf-8") as f:
-        captures = json.load(f)
+    if workers > 1:
+        captures = list(captures)
+        return len(captures), list(iter_events(captures, workers))
 
+    num_captures = 0
     all_results: List[Dict[str, Optional[Any]]] = []
     for cap in captures:
-        body = cap.get("body")
-        if not body:
-            continue
-        records = find_event_dicts(body)
-        for rec in records:
-            all_results.append(extract_event_fields(rec))
+        num_captures += 1
+        all_results.extend(iter_capture_events(cap))
+
+    return num_captures, all_results
+
+
+def parse_capture_to_events(capture_path: str) -> Tuple[int, List[Dict[str, Optional[Any]]]]:
+    """Read a Playwright capture file and extract event fields from all captured responses.
+
+    Returns (num_captures, list_of_event_dicts).
+    """
+    return extract_from_captures(iter_captures(capture_path))
 
-    return len(captures), all_results
+
+def _import_pyarrow() -> Tuple[Any, Any, Any]:
+    """Return the (pyarrow, pyarrow.parquet, pyarrow.compute) modules.
+
+    Raises RuntimeError with instructions if PyArrow is not available.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+    except Exception as exc:
+        raise RuntimeError("PyArrow is required for Parquet output. Install it with: `pip install pyarrow`") from exc
+    return pa, pq, pc
+
+
+def write_parquet(rows: Iterable[Tuple[Optional[Any], ...]], path: str) -> int:
+    """Write `EVENT_FIELDS` rows to a zstd-compressed Parquet file at `path`.
+
+    Values are accumulated column by column, so no per-event dicts are built, and
+    the price column is converted from cents to USD in one vectorized step.
+    Returns the number of rows written.
+    Raises RuntimeError with instructions if PyArrow is not available.
+    """
+    pa, pq, pc = _import_pyarrow()
+
+    columns: List[List[Optional[Any]]] = [[] for _ in EVENT_FIELDS]
+    appends = [col.append for col in columns]
+    num_rows = 0
+    for row in rows:
+        for append, value in zip(appends, row):
+            append(value)
+        num_rows += 1
+
+    arrays = {
+        name: pa.array(col, type=pa.float64() if name in PARQUET_FLOAT_FIELDS else None)
+        for name, col in zip(EVENT_FIELDS, columns)
+    }
+    arrays["ticket_price_usd"] = pc.divide(arrays["ticket_price_usd"], 100.0)
+    pq.write_table(pa.table(arrays), path, compression="zstd")
+    return num_rows
 
 
 def main(argv: Optional[list[str]] = None) -> int:
     p = argparse.ArgumentParser(description="Capture Luma calendar responses and extract event fields")
     p.add_argument("--url", default="https://luma.com/devconnect")
-    p.add_argument("--capture", default=DEFAULT_CAPTURE, help="Temporary capture file path")
+    p.add_argument("--urls", nargs="+", metavar="URL", help="Capture several pages in one browser session (overrides --url)")
+    p.add_argument("--capture", default=DEFAULT_CAPTURE, help="Capture file path (written only with --keep-capture)")
     p.add_argument("--output", default=DEFAULT_OUTPUT, help="Final extracted events JSON file")
     p.add_argument("--timeout", type=int, default=30, help="Seconds of idle time to stop scrolling")
     p.add_argument("--headless", action="store_true", help="Run browser in headless mode (default: true)")
-    p.add_argument("--keep-capture", action="store_true", help="Keep the intermediate capture file")
+    p.add_argument("--keep-capture", action="store_true", help="Also save the raw captured responses to --capture")
+    p.add_argument("--compress", action="store_true", help="Gzip the kept capture file (appends .gz to --capture)")
+    p.add_argument(
+        "--format",
+        choices=("json", "jsonl", "parquet"),
+        default="json",
+        help="Output format: JSON array, JSON Lines or Parquet (default: json)",
+    )
+    p.add_argument("--jsonl", action="store_true", help="Shorthand for --format jsonl")
+    p.add_argument("--workers", type=int, default=1, help="Processes used to extract events (default: 1)")
     args = p.parse_args(argv)
+    out_format = "jsonl" if args.jsonl else args.format
 
-    # Step 1: capture
+    # fail before launching a browser if the output format cannot be written
+    if out_format == "parquet":
+        try:
+            _import_pyarrow()
+        except RuntimeError as exc:
+            print(str(exc), file=sys.stderr)
+            return 3
+
+    # Step 1: capture (kept in memory; only written to disk with --keep-capture)
+    urls = args.urls or [args.url]
+    capture_path = args.capture if args.keep_capture else None
+    if capture_path and args.compress and not capture_path.endswith(".gz"):
+        capture_path += ".gz"
     try:
-        print(f"Starting Playwright capture of {args.url} -> {args.capture} (idle timeout {args.timeout}s)")
-        num_captures = capture_with_playwright(args.url, args.capture, timeout_idle=args.timeout, headless=not args.headless)
-        print(f"Captured {num_captures} responses to {args.capture}")
+        print(f"Starting Playwright capture of {', '.join(urls)} (idle timeout {args.timeout}s)")
+        captures = asyncio.run(
+            capture_urls(urls, capture_path, timeout_idle=args.timeout, headless=not args.headless)
+        )
+        print(f"Captured {len(captures)} responses" + (f" to {capture_path}" if capture_path else ""))
     except RuntimeError as exc:
         print(str(exc), file=sys.stderr)
         return 3
 
-    # Step 2: parse capture and write final output
-    num_caps, events = parse_capture_to_events(args.capture)
-    with open(args.output, "w", encoding="utf-8") as f:
-        json.dump(events, f, ensure_ascii=False, indent=2)
-
-    print(f"Extracted {len(events)} event records across {num_caps} captures -> {args.output}")
-
-    # Optionally remove capture file
-    if not args.keep_capture:
-        try:
-            os.remove(args.capture)
-        except Exception:
-            pass
+    # Step 2: extract events from the captured responses and write final output
+    num_caps = len(captures)
+    if out_format == "jsonl":
+        # extract -> write without holding all events in memory
+        with open(args.output, "wb") as f:
+            num_events = write_jsonl(iter_events(captures, args.workers), f)
+    elif out_format == "parquet":
+        num_events = write_parquet(iter_rows(captures, args.workers), args.output)
+    else:
+        num_caps, events = extract_from_captures(captures, args.workers)
+        with open(args.output, "wb") as f:
+            json_dump(events, f)
+        num_events = len(events)
+
+    print(f"Extracted {num_events} event records across {num_caps} captures -> {args.output}")
 
     return 0
 